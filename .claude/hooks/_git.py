@@ -0,0 +1,36 @@
+# ABOUTME: Shared git helpers imported by the commit-check hooks
+# ABOUTME: Memoizes git output so each hook process runs git at most once per query
+
+import subprocess
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def status_porcelain() -> Optional[tuple[str, ...]]:
+    """Get porcelain status lines for the working tree (cached per process).
+
+    Returns None if this is not a git repository (or git fails), otherwise the
+    status lines (empty when the tree is clean). Porcelain status never lists
+    gitignored files. Runs without optional locks so it never takes index.lock
+    out from under a concurrent git add/commit.
+    """
+    try:
+        result = subprocess.run(
+            ['git', '--no-optional-locks', 'status', '--porcelain=v1'],
+            cwd='.',
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode != 0:
+            # Not a git repo (exit 128) or git failed
+            return None
+        return tuple(line for line in result.stdout.splitlines() if line.strip())
+    except Exception:
+        return None
+
+
+def has_tracked_changes(status_lines: tuple[str, ...]) -> bool:
+    """Check if any tracked files have uncommitted changes (untracked files alone don't count)."""
+    return any(not line.startswith('??') for line in status_lines)
@@ -3,28 +3,46 @@
 # ABOUTME: Part of learning framework experiment for skill enforcement via hooks
 
 import json
+import re
 import sys
 
-def main():
-    data = json.load(sys.stdin)
-    prompt = data.get('user_prompt', '').lower()
+# High-confidence debugging keywords, as logged in the experiment's "keyword" field
+HIGH_CONF_DEBUG_KEYWORDS = (
+    'error', 'bug', 'broken', 'failing', "doesn't work",
+    'not working', 'crash', 'exception'
+)
+
+# Word-bounded forms of those keywords, matched in a single pass
+HIGH_CONF_DEBUG_RE = re.compile(
+    r"\b(?:debug\w*|bug(?:s|gy)?|errors?|error(?:ed|ing)|broken|failing|crash\w*|exceptions?)\b"
+    r"|\bdoesn't work\b|\bnot working\b",
+    re.IGNORECASE
+)
+
+# Exception class names from pasted tracebacks (TypeError, NullPointerException, ...);
+# case-sensitive so ordinary words like "terrorist" don't match
+EXCEPTION_NAME_RE = re.compile(r'\b\w*(?:Error|Exception)s?\b')
+
 
-    # High-confidence debugging keywords
-    high_conf_debug = [
-        'error', 'bug', 'broken', 'failing', "doesn't work",
-        'not working', 'crash', 'exception'
-    ]
+def canonical_keyword(matched: str) -> str:
+    """Map a matched surface form (debugging, crashed, KeyError) to its keyword."""
+    matched = matched.lower()
+    return next(kw for kw in HIGH_CONF_DEBUG_KEYWORDS if kw in matched)
+
+
+def main():
+    data = json.loads(sys.stdin.buffer.read())
+    prompt = data.get('user_prompt', '')
 
     # Check for debugging context
-    triggered_keyword = None
-    for kw in high_conf_debug:
-        if kw in prompt:
-            triggered_keyword = kw
-            break
+    match = HIGH_CONF_DEBUG_RE.search(prompt) or EXCEPTION_NAME_RE.search(prompt)
+    triggered_keyword = canonical_keyword(match.group(0)) if match else None
 
     if triggered_keyword:
-        print(f"⚠️ DEBUGGING DETECTED: Use systematic-debugging skill")
-        print(f"   Trigger keyword: '{triggered_keyword}'")
+        print(
+            "⚠️ DEBUGGING DETECTED: Use systematic-debugging skill\n"
+            f"   Trigger keyword: '{triggered_keyword}'"
+        )
         # Output to stderr for logging purposes
         print(json.dumps({
             "triggered": True,
@@ -35,7 +53,7 @@ def main():
         # Log non-trigger for experiment tracking
         print(json.dumps({
             "triggered": False,
-            "prompt_preview": prompt[:50]
+            "prompt_preview": prompt[:50].lower()
         }), file=sys.stderr)
 
 if __name__ == "__main__":
@@ -3,115 +3,36 @@
 # ABOUTME: Last safety net to ensure work is committed before session ends
 
 import json
-import subprocess
 import sys
 
+from _git import has_tracked_changes, status_porcelain
 
-def has_uncommitted_changes() -> bool:
-    """Check if there are uncommitted changes in git."""
-    try:
-        # git diff-index returns non-zero if there are changes
-        result = subprocess.run(
-            ['git', 'diff-index', '--quiet', 'HEAD', '--'],
-            cwd='.',
-            capture_output=True,
-            timeout=5
-        )
-        return result.returncode != 0
-    except Exception:
-        # If git fails, don't block (might not be a git repo)
-        return False
-
-
-def is_file_ignored(filepath: str) -> bool:
-    """Check if a file is gitignored."""
-    try:
-        result = subprocess.run(
-            ['git', 'check-ignore', '-q', filepath],
-            cwd='.',
-            capture_output=True,
-            timeout=5
-        )
-        return result.returncode == 0
-    except Exception:
-        return False
-
-
-def get_changes_summary() -> tuple[str, bool]:
-    """Get summary of uncommitted changes, filtering out gitignored files.
-
-    Returns: (summary_string, has_non_ignored_changes)
-    """
-    try:
-        result = subprocess.run(
-            ['git', 'status', '--short'],
-            cwd='.',
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            # Filter out gitignored files
-            non_ignored = []
-            for line in lines:
-                if not line.strip():
-                    continue
-                # Extract filepath from git status output (format: "XY filename" or "XY filename -> newname")
-                parts = line.split()
-                if len(parts) >= 2:
-                    filepath = parts[1]
-                    if not is_file_ignored(filepath):
-                        non_ignored.append(line)
-
-            if not non_ignored:
-                return '', False
-
-            if len(non_ignored) > 10:
-                return '\n'.join(non_ignored[:10]) + f'\n... and {len(non_ignored) - 10} more files', True
-            return '\n'.join(non_ignored), True
-    except Exception:
-        pass
-    return 'Multiple files changed', True
-
-
-def is_in_git_repo() -> bool:
-    """Check if current directory is in a git repository."""
-    try:
-        result = subprocess.run(
-            ['git', 'rev-parse', '--git-dir'],
-            cwd='.',
-            capture_output=True,
-            timeout=5
-        )
-        return result.returncode == 0
-    except Exception:
-        return False
+
+def get_changes_summary(status_lines: tuple[str, ...]) -> str:
+    """Get summary of uncommitted changes from porcelain status lines."""
+    if len(status_lines) > 10:
+        return '\n'.join(status_lines[:10]) + f'\n... and {len(status_lines) - 10} more files'
+    return '\n'.join(status_lines)
 
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
     except json.JSONDecodeError as e:
         print(f'Error: Invalid JSON input: {e}', file=sys.stderr)
         sys.exit(1)
 
-    # Check if we're in a git repository
-    if not is_in_git_repo():
+    status_lines = status_porcelain()
+    if status_lines is None:
         # Not a git repo, nothing to check
         sys.exit(0)
 
     # Check for uncommitted changes
-    if not has_uncommitted_changes():
+    if not has_tracked_changes(status_lines):
         # No uncommitted changes, all good
         sys.exit(0)
 
-    # Uncommitted changes exist - check if any are non-ignored
-    changes, has_non_ignored = get_changes_summary()
-
-    if not has_non_ignored:
-        # All changes are gitignored, nothing to commit
-        sys.exit(0)
+    changes = get_changes_summary(status_lines)
 
     message = f'''
 🛑 STOP: You have uncommitted changes
@@ -7,6 +7,9 @@ import sys
 import os
 import re
 
+# Matches filename wildcards like *.json" or *.py) in allowed_tools patterns
+FILENAME_WILDCARD_RE = re.compile(r'\*\.[a-zA-Z]+["\)]')
+
 def lint_settings_json():
     """Lint .claude/settings.json for common configuration mistakes."""
 
@@ -18,9 +21,8 @@ def lint_settings_json():
         return 0, []
 
     try:
-        with open(settings_path, 'r') as f:
-            content = f.read()
-            settings = json.loads(content)
+        with open(settings_path, 'rb') as f:
+            settings = json.loads(f.read())
     except json.JSONDecodeError as e:
         return 1, [f"Invalid JSON in settings.json: {e}"]
 
@@ -68,7 +70,7 @@ def lint_settings_json():
     # Check for filename wildcards in allowed_tools
     for tool in allowed_tools:
         # Match patterns like *.json, *.py (wildcard in filename position)
-        if re.search(r'\*\.[a-zA-Z]+["\)]', tool):
+        if FILENAME_WILDCARD_RE.search(tool):
             warnings.append(
                 f"Filename wildcard may not work in allowed_tools.\n"
                 f"  Found: {tool}\n"
@@ -4,9 +4,10 @@
 
 import json
 import re
-import subprocess
 import sys
 
+from _git import has_tracked_changes, status_porcelain
+
 # Test command patterns to detect
 TEST_COMMANDS = [
     r'\bpytest\b',
@@ -23,13 +24,19 @@ TEST_COMMANDS = [
     r'\bgradle\s+test\b',
 ]
 
+# Single compiled alternation so each command is scanned once
+TEST_COMMAND_RE = re.compile('|'.join(f'(?:{p})' for p in TEST_COMMANDS), re.IGNORECASE)
+
+# Every pattern above contains one of these substrings; commands without them skip the regex
+TEST_COMMAND_HINTS = ('test', 'phpunit')
+
 
 def is_test_command(command: str) -> bool:
     """Check if command is a test invocation."""
-    for pattern in TEST_COMMANDS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return True
-    return False
+    lowered = command.lower()
+    if not any(hint in lowered for hint in TEST_COMMAND_HINTS):
+        return False
+    return TEST_COMMAND_RE.search(command) is not None
 
 
 def tests_passed(tool_response: dict) -> bool:
@@ -44,50 +51,27 @@ def tests_passed(tool_response: dict) -> bool:
     return True
 
 
-def has_uncommitted_changes() -> bool:
-    """Check if there are uncommitted changes in git."""
-    try:
-        # git diff-index returns non-zero if there are changes
-        result = subprocess.run(
-            ['git', 'diff-index', '--quiet', 'HEAD', '--'],
-            cwd='.',
-            capture_output=True,
-            timeout=5
-        )
-        # Exit code 1 means there are changes
-        return result.returncode != 0
-    except subprocess.TimeoutExpired:
-        # If git is slow, assume no changes (don't block)
-        return False
-    except Exception:
-        # If git command fails, don't block
-        return False
-
+def get_recent_changes_summary() -> tuple[str, bool]:
+    """Get a brief summary of what changed.
 
-def get_recent_changes_summary() -> str:
-    """Get a brief summary of what changed."""
-    try:
-        result = subprocess.run(
-            ['git', 'status', '--short'],
-            cwd='.',
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            # Limit to first 5 files
-            if len(lines) > 5:
-                return '\n'.join(lines[:5]) + f'\n... and {len(lines) - 5} more files'
-            return '\n'.join(lines)
-    except Exception:
-        pass
-    return 'Multiple files changed'
+    Returns: (summary_string, has_uncommitted_changes)
+    Only tracked-file changes count as uncommitted; untracked files appear in
+    the summary but don't trigger the prompt on their own.
+    """
+    lines = status_porcelain()
+    if lines is None:
+        # Not a git repo or git failed/timed out, don't block
+        return '', False
+    dirty = has_tracked_changes(lines)
+    # Limit to first 5 files
+    if len(lines) > 5:
+        return '\n'.join(lines[:5]) + f'\n... and {len(lines) - 5} more files', dirty
+    return '\n'.join(lines), dirty
 
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
     except json.JSONDecodeError as e:
         print(f'Error: Invalid JSON input: {e}', file=sys.stderr)
         sys.exit(1)
@@ -112,14 +96,13 @@ def main():
         sys.exit(0)
 
     # Tests passed - check for uncommitted changes
-    if not has_uncommitted_changes():
+    changes, dirty = get_recent_changes_summary()
+    if not dirty:
         # No uncommitted changes, nothing to commit
         sys.exit(0)
 
     # Tests passed AND uncommitted changes exist
     # Block and prompt commit
-    changes = get_recent_changes_summary()
-
     message = f'''
 🧪 Tests passed successfully!
 
@@ -14,12 +14,30 @@ def main():
     project_dir = os.environ.get('CLAUDE_PROJECT_DIR', os.getcwd())
     progress_path = Path(project_dir) / 'project-progress.json'
     feature_path = Path(project_dir) / 'feature-list.json'
+    cache_path = Path(project_dir) / '.claude' / '.progress-cache.txt'
 
-    if not progress_path.exists():
+    try:
+        progress_mtime = progress_path.stat().st_mtime_ns
+    except OSError:
         sys.exit(0)
+    try:
+        feature_mtime = feature_path.stat().st_mtime_ns
+    except OSError:
+        feature_mtime = 0
+    # First cache line records the source mtimes the context was rendered from
+    cache_key = f"{progress_mtime} {feature_mtime}"
+
+    # Reuse the rendered context only if both source files are exactly as they were
+    try:
+        key, _, cached = cache_path.read_text().partition("\n")
+        if key == cache_key:
+            print(cached, file=sys.stderr)
+            sys.exit(0)
+    except (OSError, ValueError):
+        pass
 
     try:
-        data = json.loads(progress_path.read_text())
+        data = json.loads(progress_path.read_bytes())
     except Exception:
         sys.exit(0)
 
@@ -76,8 +94,14 @@ def main():
         for step in next_steps[:3]:
             lines.append(f"  - {step}")
 
+    context = "\n".join(lines)
+    try:
+        cache_path.write_text(f"{cache_key}\n{context}")
+    except OSError:
+        pass
+
     # Print to stderr (shown to Claude)
-    print("\n".join(lines), file=sys.stderr)
+    print(context, file=sys.stderr)
     sys.exit(0)
 
 
@@ -3,6 +3,7 @@
 # ABOUTME: Shows reminder once per session, uses temp file to track
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -29,7 +30,7 @@ See **skill-discipline** skill for full protocol.
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
     except json.JSONDecodeError as e:
         print(f'Error: Invalid JSON input: {e}', file=sys.stderr)
         sys.exit(1)
@@ -42,12 +43,14 @@ def main():
     # Check if we've already shown the reminder for this session
     reminder_file = Path('/tmp') / f'claude_skill_reminder_{session_id}'
 
-    if reminder_file.exists():
+    # Mark as shown; O_EXCL makes the existence check and creation one atomic step
+    try:
+        fd = os.open(reminder_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except FileExistsError:
         # Already shown this session
         sys.exit(0)
-
-    # Mark as shown
-    reminder_file.write_text('shown')
+    os.write(fd, b'shown')
+    os.close(fd)
 
     # Output the reminder (will be shown to Claude)
     print(SKILL_REMINDER)
@@ -2,15 +2,17 @@
 # ABOUTME: SessionStart hook that records session start time for time tracking
 # ABOUTME: Writes timestamp to /tmp for later retrieval by time-tracker subagent
 
-import glob
 import json
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+SESSION_FILE_PREFIXES = ('claude_session_start_', 'claude_session_logged_')
+
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
     except json.JSONDecodeError as e:
         print(f'Error: Invalid JSON input: {e}', file=sys.stderr)
         sys.exit(1)
@@ -22,16 +24,24 @@ def main():
         sys.exit(0)
 
     # Clean up session files from OTHER sessions (not current)
-    for pattern in ['/tmp/claude_session_start_*', '/tmp/claude_session_logged_*']:
-        for f in glob.glob(pattern):
-            if session_id not in f:
-                Path(f).unlink(missing_ok=True)
+    # Single pass over /tmp matching both prefixes
+    with os.scandir('/tmp') as entries:
+        for entry in entries:
+            if entry.name.startswith(SESSION_FILE_PREFIXES) and session_id not in entry.name:
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
 
     # Write start time to temp file (UTC for consistent time tracking)
     # Only write if file doesn't exist (preserve original start time)
     start_file = Path('/tmp') / f'claude_session_start_{session_id}'
-    if not start_file.exists():
-        start_file.write_text(datetime.now(timezone.utc).isoformat())
+    try:
+        fd = os.open(start_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except FileExistsError:
+        sys.exit(0)
+    os.write(fd, datetime.now(timezone.utc).isoformat().encode())
+    os.close(fd)
 
     # Exit cleanly (no output)
     sys.exit(0)
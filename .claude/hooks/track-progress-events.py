@@ -7,7 +7,7 @@ import sys
 import re
 import os
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Event detection patterns
 PLAN_STARTED_PATTERNS = [
@@ -34,74 +34,82 @@ DEBUG_EXCLUSIONS = [
     r"error\s+(handling|message|case)",
 ]
 
+# Compiled once at import; plan/task patterns stay separate to keep their capture groups
+PLAN_STARTED_RES = [re.compile(p, re.IGNORECASE) for p in PLAN_STARTED_PATTERNS]
+TASK_COMPLETED_RES = [re.compile(p, re.IGNORECASE) for p in TASK_COMPLETED_PATTERNS]
+DEBUG_STARTED_RE = re.compile("|".join(f"(?:{p})" for p in DEBUG_STARTED_PATTERNS), re.IGNORECASE)
+DEBUG_EXCLUSIONS_RE = re.compile("|".join(f"(?:{p})" for p in DEBUG_EXCLUSIONS), re.IGNORECASE)
+
 
 def get_events_file(session_id: str) -> Path:
     """Get path to session events temp file."""
     return Path(f"/tmp/claude_progress_events_{session_id}.jsonl")
 
 
-def log_event(session_id: str, event_type: str, **data):
-    """Append event to session events file."""
-    events_file = get_events_file(session_id)
-    event = {
+def make_event(event_type: str, timestamp: str, **data) -> dict:
+    """Build an event record."""
+    return {
         "type": event_type,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": timestamp,
         **data
     }
-    with open(events_file, "a") as f:
-        f.write(json.dumps(event) + "\n")
+
+
+def log_events(session_id: str, records: list):
+    """Append event records to session events file in a single write."""
+    if not records:
+        return
+    events_file = get_events_file(session_id)
+    with open(events_file, "ab") as f:
+        f.write(b"".join(json.dumps(r).encode() + b"\n" for r in records))
 
 
 def detect_events(prompt: str, session_id: str) -> list:
     """Detect progress events in prompt."""
     events = []
-    prompt_lower = prompt.lower()
+    records = []
+    # One timestamp for every event detected in this prompt
+    timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
     # Check for plan started
-    for pattern in PLAN_STARTED_PATTERNS:
-        match = re.search(pattern, prompt_lower)
+    for pattern in PLAN_STARTED_RES:
+        match = pattern.search(prompt)
         if match:
             plan_path = match.group(1)
-            log_event(session_id, "plan_started", plan=plan_path)
+            records.append(make_event("plan_started", timestamp, plan=plan_path))
             events.append(("plan_started", plan_path))
             break
 
     # Check for task completed
-    for pattern in TASK_COMPLETED_PATTERNS:
-        match = re.search(pattern, prompt_lower)
+    for pattern in TASK_COMPLETED_RES:
+        match = pattern.search(prompt)
         if match:
             task_num = int(match.group(1))
-            log_event(session_id, "plan_task_completed", task=task_num)
+            records.append(make_event("plan_task_completed", timestamp, task=task_num))
             events.append(("plan_task_completed", task_num))
             break
 
     # Check for debug started (with exclusions)
-    is_debug = False
-    for pattern in DEBUG_STARTED_PATTERNS:
-        if re.search(pattern, prompt_lower):
-            is_debug = True
-            break
-
-    if is_debug:
-        # Check exclusions
-        for exclusion in DEBUG_EXCLUSIONS:
-            if re.search(exclusion, prompt_lower):
-                is_debug = False
-                break
+    is_debug = (
+        DEBUG_STARTED_RE.search(prompt) is not None
+        and DEBUG_EXCLUSIONS_RE.search(prompt) is None
+    )
 
     if is_debug:
         # Extract issue description (first sentence or up to 100 chars)
-        issue = prompt[:100].split(".")[0]
-        log_event(session_id, "debug_started", issue=issue)
+        end = prompt.find(".", 0, 100)
+        issue = prompt[:end if end != -1 else 100]
+        records.append(make_event("debug_started", timestamp, issue=issue))
         events.append(("debug_started", issue))
 
+    log_events(session_id, records)
     return events
 
 
 def main():
     # Read hook input from stdin
     try:
-        hook_input = json.load(sys.stdin)
+        hook_input = json.loads(sys.stdin.buffer.read())
     except json.JSONDecodeError:
         sys.exit(0)  # No input, nothing to do
 
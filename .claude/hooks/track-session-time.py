@@ -3,13 +3,28 @@
 # ABOUTME: Blocks stopping and prompts agent to invoke time-tracker subagent
 
 import json
+import os
 import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
+def write_json_atomic(path: Path, data: dict):
+    """Write JSON via a sibling temp file + rename so readers never see a torn file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.progress-', suffix='.json')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+        # mkstemp creates the file 0600; keep the original file's permissions
+        os.chmod(tmp, path.stat().st_mode & 0o777)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
     except json.JSONDecodeError as e:
         print(f'Error: Invalid JSON input: {e}', file=sys.stderr)
         sys.exit(1)
@@ -47,17 +62,20 @@ def main():
 
     if skip_time_log:
         # Update progress.json directly for short sessions
-        import os
         project_dir = os.environ.get('CLAUDE_PROJECT_DIR', os.getcwd())
         progress_path = Path(project_dir) / 'project-progress.json'
         if progress_path.exists():
             try:
-                data = json.loads(progress_path.read_text())
-                data['lastSession']['date'] = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-                data['lastSession']['duration_minutes'] = duration_minutes
-                data['lastUpdated'] = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-                progress_path.write_text(json.dumps(data, indent=2))
-                print(f'⏱️  Short session ({duration_minutes} min) - updated progress.json', file=sys.stderr)
+                data = json.loads(progress_path.read_bytes())
+                last_session = data['lastSession']
+                session_date = end_time.strftime('%Y-%m-%d')
+                # Skip the rewrite when nothing effective changed (common reopen-and-close case)
+                if last_session.get('date') != session_date or last_session.get('duration_minutes') != duration_minutes:
+                    last_session['date'] = session_date
+                    last_session['duration_minutes'] = duration_minutes
+                    data['lastUpdated'] = end_time.isoformat().replace('+00:00', 'Z')
+                    write_json_atomic(progress_path, data)
+                    print(f'⏱️  Short session ({duration_minutes} min) - updated progress.json', file=sys.stderr)
             except Exception as e:
                 print(f'⏱️  Short session ({duration_minutes} min) - failed to update progress.json: {e}', file=sys.stderr)
 
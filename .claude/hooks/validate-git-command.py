@@ -6,20 +6,27 @@ import json
 import re
 import sys
 
-# Dangerous git commands that require explicit approval
+# Dangerous git commands that require explicit approval: (rule name, pattern, message)
 DANGEROUS_GIT_COMMANDS = [
-    (r'git\s+reset\s+--hard', 'git reset --hard permanently deletes uncommitted work. Get explicit user approval first.'),
-    (r'git\s+reset\s+HEAD~', 'git reset HEAD~ removes commits. Get explicit user approval first.'),
-    (r'git\s+clean\s+-[df]', 'git clean -fd permanently deletes untracked files. Get explicit user approval first.'),
-    (r'git\s+push\s+.*--force(?!-with-lease)', 'git push --force can cause data loss. Get explicit user approval first.'),
-    (r'git\s+checkout\s+[0-9a-f]{7,}', 'git checkout to a commit hash risks data loss. Get explicit user approval first.'),
+    ('reset_hard', r'git\s+reset\s+--hard', 'git reset --hard permanently deletes uncommitted work. Get explicit user approval first.'),
+    ('reset_head', r'git\s+reset\s+HEAD~', 'git reset HEAD~ removes commits. Get explicit user approval first.'),
+    ('clean', r'git\s+clean\s+-[df]', 'git clean -fd permanently deletes untracked files. Get explicit user approval first.'),
+    ('force_push', r'git\s+push\s+.*--force(?!-with-lease)', 'git push --force can cause data loss. Get explicit user approval first.'),
+    ('checkout_sha', r'git\s+checkout\s+[0-9a-f]{7,}', 'git checkout to a commit hash risks data loss. Get explicit user approval first.'),
+    # Destructive restore operations (--staged is safe)
+    ('restore', r'git\s+restore\s+(?!--staged).*', 'git restore (without --staged) reverts file changes. Only use if you authored the changes. Get approval first.'),
 ]
 
-# Force push to main/master is extra dangerous
-FORCE_PUSH_MAIN = r'git\s+push\s+.*--force.*\s+(origin\s+)?(main|master)'
+# Single alternation with one named group per rule, so a command is scanned once
+DANGEROUS_GIT_RE = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern, _ in DANGEROUS_GIT_COMMANDS),
+    re.IGNORECASE
+)
+DANGEROUS_GIT_MESSAGES = {name: message for name, _, message in DANGEROUS_GIT_COMMANDS}
 
-# Destructive restore operations
-DANGEROUS_RESTORE = r'git\s+restore\s+(?!--staged).*'
+# Force push to main/master is extra dangerous; it is searched on its own first so its
+# message wins even when another rule matches earlier in a chained command
+FORCE_PUSH_MAIN_RE = re.compile(r'git\s+push\s+.*--force.*\s+(?:origin\s+)?(?:main|master)', re.IGNORECASE)
 
 # Environment files that should never be edited
 PROTECTED_FILES = [
@@ -35,31 +42,31 @@ PROTECTED_FILES = [
 
 def is_dangerous_git_command(command: str) -> tuple[bool, str]:
     """Check if command is a dangerous git operation."""
-    # Check for force push to main/master
-    if re.search(FORCE_PUSH_MAIN, command, re.IGNORECASE):
-        return True, 'NEVER force push to main/master branches. This can destroy team members\' work.'
+    # Every rule starts with "git"; most Bash commands exit here without touching the regex
+    if 'git' not in command.lower():
+        return False, ''
 
-    # Check other dangerous commands
-    for pattern, message in DANGEROUS_GIT_COMMANDS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return True, message
+    if FORCE_PUSH_MAIN_RE.search(command):
+        return True, 'NEVER force push to main/master branches. This can destroy team members\' work.'
 
-    # Check for destructive restore (but allow --staged which is safe)
-    if re.search(DANGEROUS_RESTORE, command, re.IGNORECASE):
-        return True, 'git restore (without --staged) reverts file changes. Only use if you authored the changes. Get approval first.'
+    match = DANGEROUS_GIT_RE.search(command)
+    if match:
+        return True, DANGEROUS_GIT_MESSAGES[match.lastgroup]
 
     return False, ''
 
 
 def is_protected_file_operation(tool_name: str, tool_input: dict) -> tuple[bool, str]:
     """Check if operation targets protected files like .env."""
-    if tool_name not in ['Write', 'Edit']:
+    if tool_name not in ('Write', 'Edit'):
         return False, ''
 
     file_path = tool_input.get('file_path', '')
 
+    # Substring match on the whole path, so variants (.env.staging, app.env.local,
+    # my-secrets.yaml) and anything under a .env directory are protected too
     for protected in PROTECTED_FILES:
-        if protected in file_path or file_path.endswith(protected):
+        if protected in file_path:
             return True, f'NEVER edit {protected} files. Only the user may change environment configuration and secrets.'
 
     return False, ''
@@ -67,7 +74,7 @@ def is_protected_file_operation(tool_name: str, tool_input: dict) -> tuple[bool,
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
     except json.JSONDecodeError as e:
         print(f'Error: Invalid JSON input: {e}', file=sys.stderr)
         sys.exit(1)
@@ -75,21 +82,24 @@ def main():
     tool_name = input_data.get('tool_name', '')
     tool_input = input_data.get('tool_input', {})
 
-    # Check for protected file operations
-    is_protected, protected_msg = is_protected_file_operation(tool_name, tool_input)
-    if is_protected:
-        print(protected_msg, file=sys.stderr)
-        sys.exit(2)  # Exit code 2 blocks the tool call
-
-    # Check for dangerous git commands
     if tool_name == 'Bash':
+        # Check for dangerous git commands
         command = tool_input.get('command', '')
         is_dangerous, danger_msg = is_dangerous_git_command(command)
 
         if is_dangerous:
-            print(f'🛑 BLOCKED: {danger_msg}', file=sys.stderr)
-            print(f'\nCommand attempted: {command}', file=sys.stderr)
-            print('\nIf you genuinely need this operation, ask the user for explicit written approval.', file=sys.stderr)
+            print(
+                f'🛑 BLOCKED: {danger_msg}\n'
+                f'\nCommand attempted: {command}\n'
+                '\nIf you genuinely need this operation, ask the user for explicit written approval.',
+                file=sys.stderr
+            )
+            sys.exit(2)  # Exit code 2 blocks the tool call
+    elif tool_name in ('Write', 'Edit'):
+        # Check for protected file operations
+        is_protected, protected_msg = is_protected_file_operation(tool_name, tool_input)
+        if is_protected:
+            print(protected_msg, file=sys.stderr)
             sys.exit(2)  # Exit code 2 blocks the tool call
 
     # Command is safe, allow it
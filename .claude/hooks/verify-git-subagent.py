@@ -6,52 +6,65 @@ import json
 import re
 import subprocess
 import sys
+from typing import Iterable, Iterator
 
+# Phrases showing the subagent discussed committing, compiled once as one alternation
+COMMIT_MENTION_RE = re.compile(
+    r'\b(?:git\s+commit|committed|committing|create.*commit|make.*commit)\b',
+    re.IGNORECASE
+)
 
-def read_transcript(transcript_path: str) -> list[dict]:
-    """Read the JSONL transcript file."""
+# Keywords in a Task prompt/description that mark a git operations subagent
+GIT_KEYWORDS = ('commit', 'git', 'version control', 'repository')
+
+
+def read_transcript(transcript_path: str) -> Iterator[dict]:
+    """Lazily yield entries from the JSONL transcript file.
+
+    The caller can stop early, so lines after that point are never parsed.
+    Stops quietly at an unreadable file or malformed line.
+    """
     try:
-        with open(transcript_path, 'r') as f:
-            return [json.loads(line) for line in f if line.strip()]
-    except Exception:
-        return []
+        with open(transcript_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    except (OSError, ValueError):
+        return
 
 
-def is_git_operations_subagent(transcript: list[dict]) -> bool:
-    """Check if this subagent was launched for git operations."""
-    # Look through transcript for Task tool call that launched this subagent
-    for entry in transcript:
-        if entry.get('type') == 'tool_use' and entry.get('name') == 'Task':
-            params = entry.get('input', {})
-            prompt = params.get('prompt', '').lower()
-            description = params.get('description', '').lower()
+def is_git_task_launch(entry: dict) -> bool:
+    """Check if entry is a Task tool call that launched a git operations subagent."""
+    params = entry.get('input', {})
+    prompt = params.get('prompt', '').lower()
+    description = params.get('description', '').lower()
 
-            # Check for git-related keywords
-            git_keywords = ['commit', 'git', 'version control', 'repository']
-            if any(keyword in prompt or keyword in description for keyword in git_keywords):
-                return True
+    # Check for git-related keywords
+    return any(keyword in prompt or keyword in description for keyword in GIT_KEYWORDS)
 
-    return False
 
+def scan_transcript(transcript: Iterable[dict]) -> tuple[bool, bool]:
+    """Classify transcript entries in a single pass.
 
-def subagent_mentioned_commit(transcript: list[dict]) -> bool:
-    """Check if subagent discussed committing in its responses."""
-    commit_patterns = [
-        r'\bgit\s+commit\b',
-        r'\bcommitted\b',
-        r'\bcommitting\b',
-        r'\bcreate.*commit\b',
-        r'\bmake.*commit\b',
-    ]
+    Returns: (is_git_operations_subagent, subagent_mentioned_commit)
+    Stops reading as soon as both are known to be True.
+    """
+    is_git = False
+    mentioned_commit = False
 
     for entry in transcript:
-        if entry.get('type') == 'text' and entry.get('role') == 'assistant':
-            text = entry.get('content', '').lower()
-            for pattern in commit_patterns:
-                if re.search(pattern, text):
-                    return True
+        entry_type = entry.get('type')
+        if not is_git and entry_type == 'tool_use' and entry.get('name') == 'Task':
+            # Look for the Task tool call that launched this subagent
+            is_git = is_git_task_launch(entry)
+        elif not mentioned_commit and entry_type == 'text' and entry.get('role') == 'assistant':
+            # Check if subagent discussed committing in its responses
+            mentioned_commit = COMMIT_MENTION_RE.search(entry.get('content', '')) is not None
+
+        if is_git and mentioned_commit:
+            break
 
-    return False
+    return is_git, mentioned_commit
 
 
 def has_uncommitted_changes() -> bool:
@@ -60,7 +73,10 @@ def has_uncommitted_changes() -> bool:
         result = subprocess.run(
             ['git', 'diff-index', '--quiet', 'HEAD', '--'],
             cwd='.',
-            capture_output=True,
+            # Only the exit code matters; don't allocate pipes for output
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=5
         )
         return result.returncode != 0
@@ -74,7 +90,9 @@ def get_recent_commit() -> str:
         result = subprocess.run(
             ['git', 'log', '-1', '--oneline'],
             cwd='.',
-            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             timeout=5
         )
@@ -87,7 +105,7 @@ def get_recent_commit() -> str:
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
     except json.JSONDecodeError as e:
         print(f'Error: Invalid JSON input: {e}', file=sys.stderr)
         sys.exit(1)
@@ -98,17 +116,15 @@ def main():
         # No transcript path, can't verify
         sys.exit(0)
 
-    # Read transcript to understand what the subagent was supposed to do
-    transcript = read_transcript(transcript_path)
+    # Read transcript once to learn what the subagent was supposed to do and what it claimed
+    is_git, mentioned_commit = scan_transcript(read_transcript(transcript_path))
 
     # Check if this was a git operations subagent
-    if not is_git_operations_subagent(transcript):
+    if not is_git:
         # Not a git subagent, don't check
         sys.exit(0)
 
     # This was a git subagent - verify it committed
-    mentioned_commit = subagent_mentioned_commit(transcript)
-
     if not mentioned_commit:
         # Subagent didn't claim to commit, maybe it was just investigating
         sys.exit(0)